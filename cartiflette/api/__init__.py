@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
 
-from .output import download_from_cartiflette_inner
+from .output import download_from_cartiflette_inner, invalidate_cache
 
-__all__ = ["download_from_cartiflette_inner"]
+__all__ = ["download_from_cartiflette_inner", "invalidate_cache"]
@@ -1,19 +1,64 @@
 # -*- coding: utf-8 -*-
 from datetime import date
+from contextlib import contextmanager
+from functools import lru_cache
+import hashlib
+import io
+import json
 import os
 import shutil
 import tempfile
 import logging
 import typing
+import zipfile
+import fsspec
+import pandas as pd
+from pebble import ThreadPool
+import pyarrow as pa
+import pyarrow.fs
+import pyarrow.parquet as pq
+import requests
+from requests.adapters import HTTPAdapter
 import s3fs
+import shapely
 import geopandas as gpd
+from urllib3.util.retry import Retry
 
-from cartiflette.download.scraper import MasterScraper
+from cartiflette.download.scraper import (
+    MasterScraper,
+    download_to_tempfile_http,
+    download_to_bytes_http,
+)
 from cartiflette.utils import create_path_bucket, standardize_inputs
-from cartiflette.config import BUCKET, PATH_WITHIN_BUCKET, FS
+from cartiflette.config import (
+    BUCKET,
+    PATH_WITHIN_BUCKET,
+    FS,
+    ENDPOINT_URL,
+    CACHE_DIR,
+    THREADS_API_DOWNLOAD,
+    USE_PYARROW_FS,
+)
 
 logger = logging.getLogger(__name__)
 
+SHP_EXTENSIONS = ("cpg", "dbf", "prj", "shp", "shx")
+ALLOWED_DOWNLOAD_TYPES: typing.Final = frozenset(("https", "bucket"))
+
+try:
+    import pyogrio
+except ImportError:
+    ENGINE = "fiona"
+    USE_ARROW = False
+else:
+    # pyogrio reads whole columns at once (no row-by-row python iteration)
+    # and may hand them over through Arrow since version 0.7 : geometries
+    # are then decoded from the WKB buffer by shapely 2's vectorized from_wkb
+    ENGINE = "pyogrio"
+    USE_ARROW = tuple(
+        int(x) for x in pyogrio.__version__.split(".")[:2]
+    ) >= (0, 7) and int(shapely.__version__.split(".")[0]) >= 2
+
 
 def download_from_cartiflette_inner(
     values: typing.List[typing.Union[str, int, float]],
@@ -84,24 +129,26 @@ def download_from_cartiflette_inner(
     if isinstance(values, (str, int)):
         values = [values]
 
+    # Arguments shared by all values are only gathered once
+    kwargs_single = {
+        "bucket": bucket,
+        "path_within_bucket": path_within_bucket,
+        "provider": provider,
+        "dataset_family": dataset_family,
+        "source": source,
+        "vectorfile_format": vectorfile_format,
+        "borders": borders,
+        "filter_by": filter_by,
+        "territory": territory,
+        "year": year,
+        "crs": crs,
+        "simplification": simplification,
+        "filename": filename,
+    }
+
     # Iterate over values
     for value in values:
-        gdf_single = download_cartiflette_single(
-            value=value,
-            bucket=bucket,
-            path_within_bucket=path_within_bucket,
-            provider=provider,
-            dataset_family=dataset_family,
-            source=source,
-            vectorfile_format=vectorfile_format,
-            borders=borders,
-            filter_by=filter_by,
-            territory=territory,
-            year=year,
-            crs=crs,
-            simplification=simplification,
-            filename=filename,
-        )
+        gdf_single = download_cartiflette_single(value=value, **kwargs_single)
         gdf_list.append(gdf_single)
 
     # Concatenate the list of GeoDataFrames into a single GeoDataFrame
@@ -160,7 +207,7 @@ def download_cartiflette_single(
     url = f"https://minio.lab.sspcloud.fr/{url}"
 
     try:
-        gdf = gpd.read_file(url)
+        gdf = _read_file(url, driver)
     except Exception as e:
         logger.error(
             f"There was an error while reading the file from the URL: {url}"
@@ -173,6 +220,483 @@ def download_cartiflette_single(
 # ---------------------
 
 
+def _get_cache_dir(url: str, fs: s3fs.S3FileSystem = None) -> str:
+    """
+    Local directory storing the cached copy of a remote file (or of all the
+    files of a shapefile), keyed by the SHA-256 of its full url. For files
+    read from a bucket (fs not None), the S3 endpoint is part of the key, as
+    the same path may hold different files on different endpoints.
+    """
+    if fs is not None:
+        endpoint = getattr(fs, "client_kwargs", {}).get("endpoint_url", "")
+        url = f"s3::{endpoint}/{url}"
+    key = hashlib.sha256(url.encode()).hexdigest()
+    return os.path.join(CACHE_DIR, key)
+
+
+def invalidate_cache(url: str = None, fs: s3fs.S3FileSystem = None) -> None:
+    """
+    Remove files from the local cache used by download_vectorfile_single.
+
+    Parameters
+    ----------
+    url : str, optional
+        Full url (or S3 path) of the file to remove from the cache. If None,
+        the whole cache is cleared. The default is None.
+    fs : s3fs.S3FileSystem, optional
+        The s3 file system the file was read from, if url is an S3 path. The
+        default is None (https url).
+
+    Returns
+    -------
+    None
+
+    """
+    path = CACHE_DIR if url is None else _get_cache_dir(url, fs)
+    shutil.rmtree(path, ignore_errors=True)
+
+
+# Nota : a plain requests.Session (thread-safe for GETs) shared by the whole
+# process, so that connections (and TLS handshakes) are pooled across calls ;
+# files may be cached on disk by download_vectorfile_single (use_cache=True),
+# no need for MasterScraper's http cache on top of that
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.3),
+    ),
+)
+
+
+@contextmanager
+def _https_session(
+    type_download: str, session: requests.Session = None, *args, **kwargs
+) -> typing.Iterator[requests.Session]:
+    """
+    Session to perform https downloads with : session if given, else a new
+    MasterScraper if specific arguments are given (closed on exit), else the
+    module's shared requests.Session.
+
+    Parameters
+    ----------
+    type_download : str
+        The download's type to perform. No session is needed (and session is
+        yielded as is) unless it is "https".
+    session : requests.Session, optional
+        Session given by the user. The default is None.
+    *args
+        Arguments passed to MasterScraper
+    **kwargs
+        Arguments passed to MasterScraper
+
+    Yields
+    ------
+    requests.Session
+        The session
+
+    """
+    if session is not None or type_download != "https":
+        yield session
+    elif args or kwargs:
+        with MasterScraper(*args, **kwargs) as scraper:
+            yield scraper
+    else:
+        yield _SESSION
+
+
+def _ls_bucket(url: str, fs: s3fs.S3FileSystem = FS) -> typing.List[str]:
+    """
+    List the files stored under a path of the bucket, with a single listing
+    request (instead of checking the path's existence beforehand).
+
+    Parameters
+    ----------
+    url : str
+        Path of the folder on S3.
+    fs : s3fs.S3FileSystem, optional
+        The s3 file system to use. The default is cartiflette.FS.
+
+    Raises
+    ------
+    IOError
+        If nothing is stored at this path.
+
+    Returns
+    -------
+    typing.List[str]
+        Paths of the files
+
+    """
+    try:
+        files = fs.ls(url)
+    except FileNotFoundError:
+        files = []
+    if not files:
+        raise IOError(f"File has not been found at path {url} on S3")
+    return files
+
+
+def _download_vectorfile_to_dir(
+    url: str,
+    local_dir: str,
+    format_read: str,
+    type_download: str,
+    fs: s3fs.S3FileSystem = FS,
+    session: requests.Session = None,
+):
+    """
+    Download a vector file (and its auxiliary files in case of a shapefile)
+    from S3 or through https into local_dir. Files are stored as
+    raw.{extension} for shapefiles and under their remote basename otherwise.
+
+    Parameters
+    ----------
+    url : str
+        Path of the file on S3 (or full url in case of "https" download type).
+        In case of a shapefile, this is the path of the folder containing it.
+    local_dir : str
+        Local directory to store the file(s) into.
+    format_read : str
+        Standardized format of the file (see
+        cartiflette.utils.standardize_inputs)
+    type_download : str
+        The download's type to perform. Can be either "https" or "bucket".
+    fs : s3fs.S3FileSystem, optional
+        The s3 file system to use (in case of "bucket" download type). The
+        default is cartiflette.FS.
+    session : requests.Session, optional
+        The session to use (in case of "https" download type). The default is
+        None, which stands for the module's shared requests.Session.
+
+    Raises
+    ------
+    IOError
+        If the file could not be downloaded.
+
+    Returns
+    -------
+    None
+
+    """
+    if type_download == "bucket":
+        if format_read == "shp":
+            # s3fs downloads all the auxiliary files concurrently
+            remote_files = _ls_bucket(url, fs)
+            fs.get(
+                remote_files,
+                [
+                    f"{local_dir}/{os.path.basename(remote_file)}"
+                    for remote_file in remote_files
+                ],
+            )
+        else:
+            try:
+                fs.download(url, f"{local_dir}/{os.path.basename(url)}")
+            except FileNotFoundError:
+                raise IOError(f"File has not been found at path {url} on S3")
+
+    else:
+        if session is None:
+            session = _SESSION
+
+        if format_read == "shp":
+
+            def func(ext):
+                try:
+                    success, _filetype, tmp = download_to_tempfile_http(
+                        url=f"{url}raw.{ext}", session=session
+                    )
+                except IOError as e:
+                    logger.warning(e)
+                    success = False
+                if success:
+                    shutil.move(tmp, f"{local_dir}/raw.{ext}")
+                return ext, success
+
+            # One request per auxiliary file, all sent concurrently
+            with ThreadPool(len(SHP_EXTENSIONS)) as pool:
+                successes = dict(pool.map(func, SHP_EXTENSIONS).result())
+
+            # cpg, prj and shx files are not mandatory to read the file
+            failed = [ext for ext in ("shp", "dbf") if not successes[ext]]
+            if failed:
+                raise IOError(
+                    f"Download failed for {url}raw.{{{','.join(failed)}}}"
+                )
+        else:
+            success, _filetype, tmp = download_to_tempfile_http(
+                url=url, session=session
+            )
+            if not success:
+                raise IOError(f"Download failed for {url}")
+            shutil.move(tmp, f"{local_dir}/{os.path.basename(url)}")
+
+
+def _download_shapefile_to_zip(
+    url: str,
+    type_download: str,
+    fs: s3fs.S3FileSystem = FS,
+    session: requests.Session = None,
+) -> bytes:
+    """
+    Download all the files of a shapefile and bundle them into an
+    (uncompressed) zip archive held in memory, which GDAL can read without
+    writing anything to disk.
+
+    Parameters
+    ----------
+    url : str
+        Path of the folder containing the shapefile on S3 (or full url in case
+        of "https" download type).
+    type_download : str
+        The download's type to perform. Can be either "https" or "bucket".
+    fs : s3fs.S3FileSystem, optional
+        The s3 file system to use (in case of "bucket" download type). The
+        default is cartiflette.FS.
+    session : requests.Session, optional
+        The session to use (in case of "https" download type). The default is
+        None, which stands for the module's shared requests.Session.
+
+    Raises
+    ------
+    IOError
+        If the .shp or .dbf file could not be downloaded.
+
+    Returns
+    -------
+    bytes
+        Content of the zip archive
+
+    """
+    if type_download == "bucket":
+        # s3fs sends those requests concurrently
+        contents = {
+            os.path.basename(path): content
+            for path, content in fs.cat(_ls_bucket(url, fs)).items()
+        }
+    else:
+        if session is None:
+            session = _SESSION
+
+        def func(ext):
+            try:
+                content = download_to_bytes_http(
+                    url=f"{url}raw.{ext}", session=session
+                )
+            except IOError as e:
+                logger.warning(e)
+                content = None
+            return f"raw.{ext}", content
+
+        with ThreadPool(len(SHP_EXTENSIONS)) as pool:
+            contents = dict(pool.map(func, SHP_EXTENSIONS).result())
+
+        failed = [ext for ext in ("shp", "dbf") if not contents[f"raw.{ext}"]]
+        if failed:
+            raise IOError(
+                f"Download failed for {url}raw.{{{','.join(failed)}}}"
+            )
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+        for name, content in contents.items():
+            if content is not None:
+                archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=1)
+def _get_pyarrow_filesystem() -> typing.Optional[pyarrow.fs.S3FileSystem]:
+    """
+    pyarrow's native S3 filesystem, using the same credentials as
+    cartiflette.config.FS. Returns None (and logs it) if pyarrow rejects
+    those credentials (for instance a token without key and secret).
+    """
+    try:
+        return pyarrow.fs.S3FileSystem(
+            endpoint_override=ENDPOINT_URL,
+            access_key=FS.key,
+            secret_key=FS.secret,
+            session_token=FS.token,
+        )
+    except ValueError as exc:
+        logger.warning(
+            f"pyarrow's S3 filesystem unavailable, using s3fs instead : {exc}"
+        )
+        return None
+
+
+def _get_bucket_filesystem(
+    fs: s3fs.S3FileSystem,
+) -> typing.Union[s3fs.S3FileSystem, pyarrow.fs.S3FileSystem]:
+    """
+    Filesystem to read files from the bucket with : pyarrow's native
+    filesystem if the default s3fs filesystem is used (and
+    cartiflette.config.USE_PYARROW_FS is True), fs otherwise.
+    """
+    if USE_PYARROW_FS and fs is FS:
+        return _get_pyarrow_filesystem() or fs
+    return fs
+
+
+def _read_parquet(
+    path: typing.Union[str, pa.NativeFile],
+    filesystem: typing.Union[
+        fsspec.AbstractFileSystem, pyarrow.fs.FileSystem
+    ] = None,
+    columns: typing.List[str] = None,
+    filters: typing.List[tuple] = None,
+    use_pyarrow_backend: bool = False,
+) -> typing.Union[gpd.GeoDataFrame, pd.DataFrame]:
+    """
+    Read a parquet file (either local or remote), only retrieving the
+    desired columns and row groups. The result is a GeoDataFrame if the file
+    holds GeoParquet metadata and a plain DataFrame otherwise.
+
+    Parameters
+    ----------
+    path : typing.Union[str, pa.NativeFile]
+        Path to the file (relative to filesystem if set) or opened file.
+    filesystem : fsspec.AbstractFileSystem or pyarrow.fs.FileSystem, optional
+        Filesystem to read the file from. The default is None, which stands
+        for the local filesystem.
+    columns : typing.List[str], optional
+        Columns to read. The default is None (all columns).
+    filters : typing.List[tuple], optional
+        Row filters, with pyarrow.parquet.read_table syntax. The default is
+        None.
+    use_pyarrow_backend : bool, optional
+        Whether to store (non geometric) columns in pyarrow-backed arrays
+        instead of numpy ones. The default is False.
+
+    Returns
+    -------
+    typing.Union[gpd.GeoDataFrame, pd.DataFrame]
+        Content of the file
+
+    """
+    kwargs = {
+        "columns": columns,
+        "filters": filters,
+        "filesystem": filesystem,
+        # Coalesce and fetch concurrently the byte ranges of all the column
+        # chunks to read, instead of one request per column chunk
+        "pre_buffer": True,
+        "use_threads": True,
+        "buffer_size": 8 * 1024 * 1024,
+    }
+
+    # Only the footer is read here
+    metadata = pq.read_schema(path, filesystem=filesystem).metadata or {}
+    if b"geo" in metadata:
+        geo = json.loads(metadata[b"geo"])
+        wkb_only = all(
+            meta.get("encoding", "WKB").upper() == "WKB"
+            for meta in geo["columns"].values()
+        )
+        if use_pyarrow_backend and wkb_only:
+            # Nota : gpd.read_parquet only forwards to_pandas_kwargs from
+            # geopandas 1.1 on, so the GeoDataFrame is built here from a single
+            # read of the arrow table
+            return _geoparquet_table_to_geopandas(
+                pq.read_table(path, **kwargs), geo
+            )
+        if use_pyarrow_backend:
+            logger.warning(
+                "use_pyarrow_backend is only supported for WKB-encoded "
+                "GeoParquet files and will be ignored"
+            )
+        return gpd.read_parquet(path, **kwargs)
+    if use_pyarrow_backend:
+        kwargs["dtype_backend"] = "pyarrow"
+    return pd.read_parquet(path, **kwargs)
+
+
+def _geoparquet_table_to_geopandas(
+    table: pa.Table, geo: dict
+) -> gpd.GeoDataFrame:
+    """
+    Convert an arrow table read from a GeoParquet file (WKB-encoded) into a
+    GeoDataFrame, storing the non geometric columns in pyarrow-backed arrays.
+
+    Parameters
+    ----------
+    table : pa.Table
+        Table read from the file
+    geo : dict
+        Content of the file's "geo" metadata
+
+    Raises
+    ------
+    ValueError
+        If no geometry column has been read.
+
+    Returns
+    -------
+    gpd.GeoDataFrame
+        Content of the table
+
+    """
+    geometry_columns = [
+        col for col in geo["columns"] if col in table.column_names
+    ]
+    if not geometry_columns:
+        raise ValueError(
+            "No geometry columns are included in the columns read from the "
+            "Parquet file"
+        )
+    # Attribute columns are converted without any numpy/object copy
+    df = table.drop_columns(geometry_columns).to_pandas(
+        types_mapper=pd.ArrowDtype
+    )
+    for col in geometry_columns:
+        # GeoParquet's default CRS is OGC:CRS84
+        crs = geo["columns"][col].get("crs", "OGC:CRS84")
+        df[col] = gpd.GeoSeries.from_wkb(
+            table[col].to_numpy(zero_copy_only=False), index=df.index, crs=crs
+        )
+    df = df[[col for col in table.column_names if col in df.columns]]
+    primary_column = geo.get("primary_column")
+    if primary_column not in geometry_columns:
+        primary_column = geometry_columns[0]
+    return gpd.GeoDataFrame(df, geometry=primary_column)
+
+
+def _read_file(
+    path: typing.Union[str, io.BytesIO],
+    driver: str = None,
+    columns: typing.List[str] = None,
+) -> gpd.GeoDataFrame:
+    """
+    Read a vector file (any format but parquet) with the fastest available
+    engine.
+
+    Parameters
+    ----------
+    path : typing.Union[str, io.BytesIO]
+        Path to the file or file's content.
+    driver : str, optional
+        Driver to use with fiona (pyogrio infers it by itself). The default
+        is None.
+    columns : typing.List[str], optional
+        Columns to read. The default is None (all columns).
+
+    Returns
+    -------
+    gpd.GeoDataFrame
+        Content of the file
+
+    """
+    if ENGINE == "pyogrio":
+        return gpd.read_file(
+            path, engine="pyogrio", use_arrow=USE_ARROW, columns=columns
+        )
+    return gpd.read_file(path, engine="fiona", driver=driver, columns=columns)
+
+
 def download_vectorfile_single(
     bucket: str = BUCKET,
     path_within_bucket: str = PATH_WITHIN_BUCKET,
@@ -189,9 +713,14 @@ def download_vectorfile_single(
     simplification: typing.Union[str, int, float] = None,
     type_download: str = "https",
     fs: s3fs.S3FileSystem = FS,
+    use_cache: bool = False,
+    columns: typing.List[str] = None,
+    filters: typing.List[tuple] = None,
+    use_pyarrow_backend: bool = False,
+    session: requests.Session = None,
     *args,
     **kwargs,
-) -> gpd.GeoDataFrame:
+) -> typing.Union[gpd.GeoDataFrame, pd.DataFrame]:
     """
     This function downloads a single vector file (from a specified S3 bucket or
     an URL) and returns it as a GeoPandas object.
@@ -237,20 +766,49 @@ def download_vectorfile_single(
     fs : s3fs.S3FileSystem, optional
         The s3 file system to use (in case of "bucket" download type). The
         default is cartiflette.FS.
+    use_cache : bool, optional
+        Whether to keep a local copy of the file (in
+        cartiflette.config.CACHE_DIR) and reuse it on later calls instead of
+        downloading it again. Cached files are never revalidated : call
+        cartiflette.api.invalidate_cache to refresh them (for instance after
+        the current vintage has been regenerated). If False, the file is read
+        from memory, without writing anything to disk. The default is False.
+    columns : typing.List[str], optional
+        Columns to read. For the parquet format, only the matching column
+        chunks are then fetched from the remote file (which is then not
+        cached). The default is None (all columns).
+    filters : typing.List[tuple], optional
+        Row filters, with pyarrow.parquet.read_table syntax (parquet format
+        only). Row groups which do not match are not fetched from the remote
+        file, which is then not cached. The default is None.
+    use_pyarrow_backend : bool, optional
+        Whether to store (non geometric) columns in pyarrow-backed arrays
+        (parquet format only). This roughly halves the memory used by string
+        columns and speeds up merges and groupbys, but accessing a column's
+        .values then returns an ArrowExtensionArray instead of a numpy array.
+        The default is False.
+    session : requests.Session, optional
+        The session to use (in case of "https" download type). The default is
+        None : a requests.Session shared by all calls will be used (or a new
+        MasterScraper, with its own http cache, if *args or **kwargs are
+        given).
     *args
-        Arguments passed to requests.Session (in case of "https" download type)
+        Arguments passed to MasterScraper (in case of "https" download type)
     **kwargs
-        Arguments passed to requests.Session (in case of "https" download type)
+        Arguments passed to MasterScraper (in case of "https" download type)
 
     Raises
     ------
     ValueError
         If type_download not among "https", "bucket".
+    IOError
+        If the file could not be downloaded.
 
     Returns
     -------
-    gdf : gpd.GeoDataFrame
-        The vector file as a GeoPandas object
+    gdf : typing.Union[gpd.GeoDataFrame, pd.DataFrame]
+        The vector file as a GeoPandas object (or a plain pandas DataFrame
+        for a parquet file without GeoParquet metadata)
 
     """
     if not year:
@@ -260,7 +818,7 @@ def download_vectorfile_single(
         vectorfile_format
     )
 
-    if type_download not in ("https", "bucket"):
+    if type_download not in ALLOWED_DOWNLOAD_TYPES:
         msg = (
             "type_download must be either 'https' or 'bucket' - "
             f"found '{type_download}' instead"
@@ -285,62 +843,94 @@ def download_vectorfile_single(
         }
     )
 
-    if type_download == "bucket":
-        try:
-            fs.exists(url)
-        except Exception:
-            raise IOError(f"File has not been found at path {url} on S3")
+    if type_download == "https":
+        url = f"{ENDPOINT_URL}/{url}"
 
-        if format_read == "shp":
-            tdir = tempfile.TemporaryDirectory()
-            files = fs.ls(url)
-            for remote_file in files:
-                local_path = f"{tdir.name}/{remote_file.replace(url, '')}"
-                fs.download(remote_file, local_path)
-            local_path = f"{tdir.name}/raw.shp"
+    filename = "raw.shp" if format_read == "shp" else os.path.basename(url)
+    cache_dir = _get_cache_dir(url, fs if type_download == "bucket" else None)
+    local_path = os.path.join(cache_dir, filename)
 
-        else:
-            tfile = tempfile.TemporaryFile()
-            local_path = tfile.name
-            fs.download(remote_file, local_path)
+    partial_read = columns is not None or filters is not None
 
-    else:
-        with MasterScraper(*args, **kwargs) as s:
-            # Note that python should cleanup all tmpfile by itself
-
-            if format_read == "shp":
-                tdir = tempfile.TemporaryDirectory()
-                for ext in ["cpg", "dbf", "prj", "shp", "shx"]:
-                    successes = []
-                    for remote_file in files:
-                        remote = os.path.splitext(url)[0] + f".{ext}"
-                        success, tmp = s.download_to_tempfile_http(
-                            url=remote
-                        )
-                        successes.append(success)
-                        shutil.copy(tmp, f"{tdir.name}/raw.{ext}")
-                    local_path = f"{tdir.name}/raw.shp"
-                    success = any(successes)
+    if use_cache and os.path.exists(local_path):
+        logger.debug(f"{url} found in cache at {cache_dir}")
+    elif format_read == "parquet" and (
+        partial_read or (not use_cache and type_download == "bucket")
+    ):
+        # Read straight from remote storage : pyarrow will only fetch the
+        # needed byte ranges
+        if type_download == "bucket":
+            filesystem = _get_bucket_filesystem(fs)
+        else:
+            filesystem = fsspec.filesystem("https")
+        return _read_parquet(
+            url,
+            filesystem,
+            columns=columns,
+            filters=filters,
+            use_pyarrow_backend=use_pyarrow_backend,
+        )
+    elif not use_cache:
+        # Decode the file from memory instead of writing it to a tempfile
+        # first
+        if format_read == "shp":
+            # GDAL reads the auxiliary files from an in-memory zip archive
+            with _https_session(
+                type_download, session, *args, **kwargs
+            ) as session:
+                content = _download_shapefile_to_zip(
+                    url, type_download, fs, session
+                )
+        elif type_download == "bucket":
+            filesystem = _get_bucket_filesystem(fs)
+            if isinstance(filesystem, pyarrow.fs.FileSystem):
+                with filesystem.open_input_file(url) as f:
+                    content = f.read()
             else:
-                success, local_path = s.download_to_tempfile_http(url=url)
-
-        if not success:
-            raise IOError("Download failed")
+                content = filesystem.cat_file(url)
+        else:
+            with _https_session(
+                type_download, session, *args, **kwargs
+            ) as session:
+                content = download_to_bytes_http(url=url, session=session)
+        if format_read == "parquet":
+            return _read_parquet(
+                pa.BufferReader(content),
+                columns=columns,
+                filters=filters,
+                use_pyarrow_backend=use_pyarrow_backend,
+            )
+        return _read_file(io.BytesIO(content), driver, columns=columns)
+    else:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # same filesystem as the cache, for an atomic os.replace
+        tdir = tempfile.mkdtemp(dir=CACHE_DIR)
+        try:
+            with _https_session(
+                type_download, session, *args, **kwargs
+            ) as session:
+                _download_vectorfile_to_dir(
+                    url, tdir, format_read, type_download, fs, session
+                )
+            os.replace(tdir, cache_dir)
+        except OSError as e:
+            shutil.rmtree(tdir, ignore_errors=True)
+            if not os.path.exists(local_path):
+                raise e
+            # else : already stored by a concurrent call
+        except Exception:
+            shutil.rmtree(tdir, ignore_errors=True)
+            raise
 
     if format_read == "parquet":
-        gdf = gpd.read_parquet(local_path)
+        gdf = _read_parquet(
+            local_path,
+            columns=columns,
+            filters=filters,
+            use_pyarrow_backend=use_pyarrow_backend,
+        )
     else:
-        gdf = gpd.read_file(local_path, driver=driver)
-
-    # Cleanup
-    try:
-        os.unlink(local_path)
-    except Exception:
-        pass
-    try:
-        shutil.rmtree(tdir)
-    except Exception:
-        pass
+        gdf = _read_file(local_path, driver, columns=columns)
 
     return gdf
 
@@ -358,9 +948,8 @@ def download_vectorfile_multiple(
     crs: typing.Union[list, str, int, float] = 2154,
     type_download: str = "https",
     fs: s3fs.S3FileSystem = FS,
-    *args,
     **kwargs,
-) -> gpd.GeoDataFrame:
+) -> typing.Union[gpd.GeoDataFrame, pd.DataFrame]:
     """
     This function performs multiple downloads of individual vector files (from
     a specified S3 bucket or an URL) and returns their concatenation as a
@@ -408,8 +997,6 @@ def download_vectorfile_multiple(
     fs : s3fs.S3FileSystem, optional
         The s3 file system to use (in case of "bucket" download type). The
         default is cartiflette.FS.
-    *args
-        Arguments passed to requests.Session (in case of "https" download type)
     **kwargs
         Arguments passed to requests.Session (in case of "https" download type)
 
@@ -420,8 +1007,9 @@ def download_vectorfile_multiple(
 
     Returns
     -------
-    gdf : gpd.GeoDataFrame
-        The vector file as a GeoPandas object
+    gdf : typing.Union[gpd.GeoDataFrame, pd.DataFrame]
+        The vector files as a GeoPandas object (or a plain pandas DataFrame
+        for parquet files without GeoParquet metadata)
 
     """
 
@@ -431,32 +1019,41 @@ def download_vectorfile_multiple(
     if isinstance(values, (str, int, float)):
         values = [str(values)]
 
-    if type_download not in ("https", "bucket"):
+    if type_download not in ALLOWED_DOWNLOAD_TYPES:
         msg = (
             "type_download must be either 'https' or 'bucket' - "
             f"found '{type_download}' instead"
         )
         raise ValueError(msg)
 
-    vectors = [
-        download_vectorfile_single(
-            bucket=bucket,
-            path_within_bucket=path_within_bucket,
-            provider=provider,
-            source=source,
-            vectorfile_format=vectorfile_format,
-            borders=borders,
-            filter_by=filter_by,
-            year=year,
-            value=val,
-            crs=crs,
-            type_download=type_download,
-            fs=fs,
-            *args**kwargs,
-        )
-        for val in values
-    ]
+    # Arguments shared by all values are only gathered once
+    kwargs_single = {
+        "bucket": bucket,
+        "path_within_bucket": path_within_bucket,
+        "provider": provider,
+        "source": source,
+        "vectorfile_format": vectorfile_format,
+        "borders": borders,
+        "filter_by": filter_by,
+        "year": year,
+        "crs": crs,
+        "type_download": type_download,
+        "fs": fs,
+        **kwargs,
+    }
+
+    def func(val):
+        return download_vectorfile_single(value=val, **kwargs_single)
+
+    # Downloads are I/O bound : perform those concurrently (the pool's size
+    # also bounds the number of simultaneous requests sent to S3)
+    threads = min(THREADS_API_DOWNLOAD, len(values))
+    if threads > 1:
+        with ThreadPool(threads) as pool:
+            vectors = list(pool.map(func, values).result())
+    else:
+        vectors = [func(val) for val in values]
 
-    vectors = gpd.pd.concat(vectors)
+    vectors = gpd.pd.concat(vectors, ignore_index=True)
 
     return vectors
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 import os
+from appdirs import user_cache_dir
 from dotenv import load_dotenv
 import s3fs
 
@@ -15,10 +16,30 @@ for key in ["token", "secret", "key"]:
         kwargs[key] = os.environ[key]
     except KeyError:
         continue
-FS = s3fs.S3FileSystem(client_kwargs={"endpoint_url": ENDPOINT_URL}, **kwargs)
+FS = s3fs.S3FileSystem(
+    client_kwargs={"endpoint_url": ENDPOINT_URL},
+    config_kwargs={"max_pool_connections": 50},
+    **kwargs,
+)
+# Nota : botocore defaults to 10 pooled connections, which throttles the
+# batched transfers (fs.cat, fs.get and fs.put on lists of files)
+
+USE_PYARROW_FS = True
+# Nota : pyarrow's native S3 filesystem (built from FS' credentials on first
+# use) is used instead of FS to read files from the bucket in cartiflette.api
+# (native C++ reads, without any GIL-bound callback); set to False to use
+# s3fs instead
+
+CACHE_DIR = user_cache_dir("cartiflette")
+# Local copies of the files downloaded through cartiflette.api with
+# use_cache=True (one subdirectory per remote url)
 
 THREADS_DOWNLOAD = 5
 # Nota : each thread may also span the same number of children threads;
 # set to 1 for debugging purposes (will deactivate multithreading)
 
+THREADS_API_DOWNLOAD = 16
+# Nota : max number of files simultaneously downloaded by cartiflette.api
+# (those are small, latency-bound downloads); set to 1 for debugging purposes
+
 LEAVE_TQDM = False
@@ -6,6 +6,7 @@
 # =============================================================================
 
 from collections import OrderedDict
+from concurrent.futures import as_completed
 from itertools import product
 import logging
 from pebble import ThreadPool
@@ -290,12 +291,10 @@ def _download_sources(
 
         if THREADS_DOWNLOAD > 1:
             with ThreadPool(THREADS_DOWNLOAD) as pool:
-                iterator = pool.map(func, combinations).result()
-                while True:
+                futures = [pool.schedule(func, args=(args,)) for args in combinations]
+                for future in as_completed(futures):
                     try:
-                        files = deep_dict_update(files, next(iterator))
-                    except StopIteration:
-                        break
+                        files = deep_dict_update(files, future.result())
                     except Exception as e:
                         logger.error(e)
                         logger.error(traceback.format_exc())
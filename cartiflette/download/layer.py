@@ -4,6 +4,7 @@ import fiona
 import geopandas as gpd
 import logging
 import os
+from pyproj import CRS
 from shapely.geometry import box
 
 from cartiflette.download.dataset import Dataset
@@ -95,9 +96,18 @@ class Layer:
         kwargs = {"encoding": encoding} if encoding else {}
         ref_gis_file = self._get_gis_file()
         try:
-            # Note : read all rows to evaluate bbox / territory
-            gdf = gpd.read_file(ref_gis_file, **kwargs)
-            self.crs = gdf.crs.to_epsg()
+            # Probe the metadata first : files without any CRS (csv, dbf
+            # without shp, ...) are handled as non-GIS datasets below and
+            # don't need to be fully parsed
+            with fiona.open(ref_gis_file, **kwargs) as src:
+                if not src.crs:
+                    raise AttributeError(f"{ref_gis_file} has no CRS")
+                # Nota : the layer's extent is stored in its metadata (the
+                # shapefile's header for instance), no need to read all rows
+                # to evaluate bbox / territory
+                crs = CRS.from_wkt(src.crs_wkt)
+                bounds = src.bounds
+            self.crs = crs.to_epsg()
 
             if not self.crs:
                 logger.warning(
@@ -106,8 +116,10 @@ class Layer:
                 )
 
                 # Let's reproject...
-                gdf = gdf.to_crs(4326)
+                gdf = gpd.read_file(ref_gis_file, **kwargs).to_crs(4326)
                 self.crs = 4326
+                crs = gdf.crs
+                bounds = gdf.total_bounds
 
                 # let's overwrite initial files
                 gdf.to_file(ref_gis_file, encoding="utf-8")
@@ -117,6 +129,7 @@ class Layer:
                     f"{self} - encoding={encoding}, " "layer will be re-encoded to UTF8"
                 )
                 # let's overwrite initial files with utf8...
+                gdf = gpd.read_file(ref_gis_file, **kwargs)
                 gdf.to_file(ref_gis_file, encoding="utf-8")
 
         except (AttributeError, fiona.errors.DriverError):
@@ -124,8 +137,8 @@ class Layer:
             self.crs = None
 
         if self.crs:
-            bbox = box(*gdf.total_bounds)
-            bbox = gpd.GeoSeries([bbox], crs=gdf.crs)
+            bbox = box(*bounds)
+            bbox = gpd.GeoSeries([bbox], crs=crs)
 
             intersects = REFERENCES.sjoin(
                 bbox.to_frame().to_crs(REFERENCES.crs),
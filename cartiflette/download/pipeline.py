@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+from concurrent.futures import as_completed
 from datetime import date
 import json
 import logging
@@ -133,12 +134,14 @@ def download_all(
 
     if THREADS_DOWNLOAD > 1:
         with ThreadPool(THREADS_DOWNLOAD) as pool:
-            iterator = pool.map(func, datasets_args.items()).result()
-            while True:
+            futures = [
+                pool.schedule(func, args=(args,)) for args in datasets_args.items()
+            ]
+            # Merge each result as soon as it is available (a slow dataset
+            # does not hold back the ones already downloaded)
+            for future in as_completed(futures):
                 try:
-                    results = deep_dict_update(results, next(iterator))
-                except StopIteration:
-                    break
+                    results = deep_dict_update(results, future.result())
                 except Exception as e:
                     logger.error(e)
     else:
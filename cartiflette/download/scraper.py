@@ -2,6 +2,7 @@
 
 import magic
 from glob import glob
+import hashlib
 import logging
 import numpy as np
 import os
@@ -383,3 +384,67 @@ def download_to_tempfile_http(
     filetype = magic.from_file(file_path)
 
     return True, filetype, file_path
+
+
+def download_to_bytes_http(
+    url: str,
+    session: requests.Session = None,
+    **kwargs,
+) -> bytes:
+    """
+    Performs a HTTP(S) download that will ensure file integrity (through
+    md5 hash signature or file's length if available) and returns the file's
+    content, without writing it on disk. This should only be used on files
+    small enough to fit in memory.
+
+    Parameters
+    ----------
+    url : str
+        url to download the file from
+    session : requests.Session
+        session object to use. If None, will create a new empty
+        requests.Session. session can be of any class which inherits from
+        requests.Session, as a requests_cache.CachedSession
+    **kwargs :
+        Additional kwargs are passed to requests.get (though any "stream"
+        value will be ignored)
+
+    Raises
+    ------
+    IOError
+        If validation of downloaded file fails (through expected
+        md5-content or Content-length response headers)
+
+    Returns
+    -------
+    bytes
+        Content of the file
+
+    """
+
+    # ignore kwargs["stream"] if it is passed in kwargs
+    try:
+        del kwargs["stream"]
+    except KeyError:
+        pass
+
+    if session is None:
+        session = requests.Session()
+
+    logger.debug(f"starting download at {url}")
+    r = session.get(url, **kwargs)
+    if not r.ok:
+        raise IOError(f"download failed with {r.status_code} code")
+    content = r.content
+    head = r.headers
+
+    # Check that the downloaded content has the expected characteristics
+    if "content-md5" in head:
+        if not hashlib.md5(content).hexdigest() == head["content-md5"]:
+            raise IOError("download failed (corrupted file)")
+    elif "Content-length" in head and "Content-Encoding" not in head:
+        # Content-length is the size of the encoded (ie compressed) body
+        if not int(head["Content-length"]) == len(content):
+            raise IOError("download failed (corrupted file)")
+
+    return content
@@ -105,7 +105,7 @@ def mapshaperize_split(
         # STEP 1B: DISSOLVE IF NEEDED
         cmd_dissolve = (
             f"mapshaper {temp_filename} "
-            f"name='' -proj EPSG:4326 "
+            f"name='' "
             f"-dissolve {dict_corresp[niveau_polygons]} "
             f"calc='POPULATION=sum(POPULATION)' "
             f"copy-fields={csv_list_vars} "
@@ -184,17 +184,13 @@ def mapshaperize_split_merge(
 
     # PREPROCESS CITIES
     file_city = f"{directory_city}/{initial_filename_city}.{extension_initial_city}"
-    subprocess.run(
-        (
-            f"mapshaper {file_city} name='COMMUNE' "
-            f"-proj EPSG:4326 "
-            f"-filter '\"69123,13055,75056\".indexOf(INSEE_COM) > -1' invert "
-            f'-each "INSEE_COG=INSEE_COM" '
-            f"-o {output_path}/communes_simples.{format_intermediate} "
-            f'format={format_intermediate} extension=".{format_intermediate}" singles'
-        ),
-        shell=True,
-        check=True,
+    cmd_city = (
+        f"mapshaper {file_city} name='COMMUNE' "
+        f"-proj EPSG:4326 "
+        f"-filter '\"69123,13055,75056\".indexOf(INSEE_COM) > -1' invert "
+        f'-each "INSEE_COG=INSEE_COM" '
+        f"-o {output_path}/communes_simples.{format_intermediate} "
+        f'format={format_intermediate} extension=".{format_intermediate}" singles'
     )
 
     # PREPROCESS ARRONDISSEMENT
@@ -202,27 +198,40 @@ def mapshaperize_split_merge(
         f"{directory_arrondissement}/"
         f"{initial_filename_arrondissement}.{extension_initial_arrondissement}"
     )
-    subprocess.run(
-        (
-            f"mapshaper {file_arrondissement} "
-            f"name='ARRONDISSEMENT_MUNICIPAL' "
-            f"-proj EPSG:4326 "
-            f"-rename-fields INSEE_COG=INSEE_ARM "
-            f"-each 'STATUT=\"Arrondissement municipal\" ' "
-            f"-o {output_path}/arrondissements.{format_intermediate} "
-            f'format={format_intermediate} extension=".{format_intermediate}"'
-        ),
-        shell=True,
-        check=True,
+    cmd_arrondissement = (
+        f"mapshaper {file_arrondissement} "
+        f"name='ARRONDISSEMENT_MUNICIPAL' "
+        f"-proj EPSG:4326 "
+        f"-rename-fields INSEE_COG=INSEE_ARM "
+        f"-each 'STATUT=\"Arrondissement municipal\" ' "
+        f"-o {output_path}/arrondissements.{format_intermediate} "
+        f'format={format_intermediate} extension=".{format_intermediate}"'
     )
 
+    # Both preprocessing steps are independent : run them concurrently
+    os.makedirs(output_path, exist_ok=True)
+    cmds = (cmd_city, cmd_arrondissement)
+    processes = [subprocess.Popen(cmd, shell=True) for cmd in cmds]
+    try:
+        # Wait for both before raising, so that no process keeps writing
+        # into output_path
+        returncodes = [process.wait() for process in processes]
+    finally:
+        # Only reached with running processes if interrupted
+        for process in processes:
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+    for cmd, returncode in zip(cmds, returncodes):
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, cmd)
+
     # MERGE CITIES AND ARRONDISSEMENT
     subprocess.run(
         (
             f"mapshaper "
             f"{output_path}/communes_simples.{format_intermediate} "
             f"{output_path}/arrondissements.{format_intermediate} snap combine-files "
-            f"-proj EPSG:4326 "
             f"-rename-layers COMMUNE,ARRONDISSEMENT_MUNICIPAL "
             f"-merge-layers target=COMMUNE,ARRONDISSEMENT_MUNICIPAL force "
             f"-rename-layers COMMUNE_ARRONDISSEMENT "
@@ -1,6 +1,9 @@
+import os
 import subprocess
 
-from cartiflette.config import FS, PATH_WITHIN_BUCKET
+from pebble import ThreadPool
+
+from cartiflette.config import FS, PATH_WITHIN_BUCKET, THREADS_DOWNLOAD
 from cartiflette.utils import import_yaml_config
 from cartiflette.mapshaper import mapshaper_convert_mercator
 from cartiflette.s3 import upload_s3_raw
@@ -26,7 +29,8 @@ def combine_adminexpress_territory(
         for territ in list_territories
     }
 
-    for territory, path_bucket in list_location_raw.items():
+    def func(args):
+        territory, path_bucket = args
         prepare_local_directory_mapshaper(
             path_bucket,
             borders="COMMUNE",
@@ -37,18 +41,25 @@ def combine_adminexpress_territory(
             local_dir=local_dir,
             fs=fs,
         )
-
-    for territ in list_territories:
-        mapshaper_convert_mercator(
-            local_dir=local_dir, territory=territ, identifier=territ
+        return mapshaper_convert_mercator(
+            local_dir=local_dir, territory=territory, identifier=territory
         )
 
+    # Each territory is downloaded then converted independently of the others
+    # (mapshaper runs in its own process) : process them concurrently
+    os.makedirs(f"{local_dir}/preprocessed", exist_ok=True)
+    if THREADS_DOWNLOAD > 1:
+        with ThreadPool(THREADS_DOWNLOAD) as pool:
+            list(pool.map(func, list_location_raw.items()).result())
+    else:
+        for args in list_location_raw.items():
+            func(args)
+
     output_path = f"{local_dir}/preprocessed_combined/raw.{format_intermediate}"
 
     subprocess.run(
         (
             f"mapshaper -i {local_dir}/preprocessed/*.geojson combine-files name='COMMUNE' "
-            f"-proj EPSG:4326 "
             f"-merge-layers "
             f"-o {output_path} "
             f'format={format_intermediate} extension=".{format_intermediate}" singles'
@@ -63,6 +63,7 @@ def mapshaperize_split_from_s3(config, fs=FS):
         simplification=simplification,
     )
 
+    local_files, paths_s3 = [], []
     for values in os.listdir(output_path):
         path_s3 = create_path_bucket(
             {
@@ -81,7 +82,12 @@ def mapshaperize_split_from_s3(config, fs=FS):
                 "simplification": simplification,
             }
         )
-        fs.put(f"{output_path}/{values}", path_s3)
+        local_files.append(f"{output_path}/{values}")
+        paths_s3.append(path_s3)
+
+    # Nota : uploading all files in a single call lets s3fs run the PUTs
+    # concurrently instead of one at a time
+    fs.put(local_files, paths_s3)
 
     shutil.rmtree(output_path)
 
@@ -177,6 +183,7 @@ def mapshaperize_merge_split_from_s3(config, fs=FS):
         simplification=simplification,
     )
 
+    local_files, paths_s3 = [], []
     for values in os.listdir(output_path):
         path_s3 = create_path_bucket(
             {
@@ -195,6 +202,11 @@ def mapshaperize_merge_split_from_s3(config, fs=FS):
                 "simplification": simplification,
             }
         )
-        fs.put(f"{output_path}/{values}", path_s3)
+        local_files.append(f"{output_path}/{values}")
+        paths_s3.append(path_s3)
+
+    # Nota : uploading all files in a single call lets s3fs run the PUTs
+    # concurrently instead of one at a time
+    fs.put(local_files, paths_s3)
 
     shutil.rmtree(output_path)
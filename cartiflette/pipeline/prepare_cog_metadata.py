@@ -76,28 +76,46 @@ def prepare_cog_metadata(
             dtype={"REG": "string[pyarrow]"},
         )
 
+    # Only parse the columns used in the merge below
     with fs.open(path_bucket_cog_departement, mode="rb") as remote_file:
         cog_dep = pd.read_csv(
-            remote_file, dtype_backend="pyarrow", dtype={"REG": "string[pyarrow]"}
+            remote_file,
+            usecols=["DEP", "REG", "LIBELLE"],
+            dtype_backend="pyarrow",
+            dtype={"REG": "string[pyarrow]"},
         )
 
     with fs.open(path_bucket_cog_region, mode="rb") as remote_file:
         cog_region = pd.read_csv(
-            remote_file, dtype_backend="pyarrow", dtype={"REG": "string[pyarrow]"}
+            remote_file,
+            usecols=["REG", "LIBELLE"],
+            dtype_backend="pyarrow",
+            dtype={"REG": "string[pyarrow]"},
         )
 
     # Merge DEPARTEMENT and REGION COG metadata
     cog_metadata = (
-        cog_dep.loc[:, ["DEP", "REG", "LIBELLE"]]
-        .merge(
-            cog_region.loc[:, ["REG", "LIBELLE"]],
+        cog_dep.merge(
+            cog_region,
             on="REG",
+            how="inner",
             suffixes=["_DEPARTEMENT", "_REGION"],
+            validate="many_to_one",
+            sort=False,
         )
         .drop(columns=["REG"])
     )
 
-    # Merge TAGC metadata with COG metadata
-    tagc_metadata = tagc.merge(cog_metadata)
+    # Broadcast COG metadata onto TAGC through lookups on DEP (unique in
+    # cog_metadata) instead of a hash-join ; as with an inner merge, cities
+    # without any matching DEP are dropped
+    cog_metadata = cog_metadata.set_index("DEP")
+    tagc_metadata = tagc.loc[tagc["DEP"].isin(cog_metadata.index)]
+    tagc_metadata = tagc_metadata.assign(
+        **{
+            col: tagc_metadata["DEP"].map(cog_metadata[col])
+            for col in cog_metadata.columns
+        }
+    ).reset_index(drop=True)
 
     return tagc_metadata
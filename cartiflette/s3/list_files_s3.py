@@ -1,3 +1,9 @@
+CHUNK_SIZE = 16 * 1024**2
+# Nota : files larger than this are downloaded through concurrent ranged GETs
+# (by batches of RANGES_PER_BATCH, which bounds the memory used)
+RANGES_PER_BATCH = 8
+
+
 def list_raw_files_level(fs, path_bucket, borders):
     """
     Lists raw files at a specific level within the file system.
@@ -43,6 +49,56 @@ def download_files_from_list(fs, list_raw_files, local_dir="temp"):
     str
         The path of the local directory where the files are downloaded.
     """
+    small_files, large_files = [], []
     for files in list_raw_files:
-        fs.download(files, f"{local_dir}/{files.rsplit('/', maxsplit=1)[-1]}")
+        local_file = f"{local_dir}/{files.rsplit('/', maxsplit=1)[-1]}"
+        # Nota : fs.size is served from the listing cache after fs.ls
+        size = fs.size(files)
+        if size > CHUNK_SIZE:
+            large_files.append((files, local_file, size))
+        else:
+            small_files.append((files, local_file))
+
+    # Nota : a single call with lists lets s3fs download all the small files
+    # (ie. the sidecars of a shapefile) concurrently
+    if small_files:
+        fs.get(*map(list, zip(*small_files)))
+
+    for files, local_file, size in large_files:
+        _download_by_ranges(fs, files, local_file, size)
+
     return local_dir
+
+
+def _download_by_ranges(fs, remote_file, local_file, size):
+    """
+    Downloads a large file through concurrent ranged GETs of CHUNK_SIZE bytes
+    (a single GET is bound to one connection's throughput).
+
+    Parameters
+    ----------
+    fs : FileSystem
+        The file system object.
+    remote_file : str
+        Path of the file in the file system.
+    local_file : str
+        Local path to write the file to.
+    size : int
+        Size of the file in bytes.
+
+    Returns
+    -------
+    None
+    """
+    starts = list(range(0, size, CHUNK_SIZE))
+    with open(local_file, "wb") as f:
+        for i in range(0, len(starts), RANGES_PER_BATCH):
+            batch = starts[i : i + RANGES_PER_BATCH]
+            blocks = fs.cat_ranges(
+                [remote_file] * len(batch),
+                batch,
+                [min(start + CHUNK_SIZE, size) for start in batch],
+                on_error="raise",
+            )
+            for block in blocks:
+                f.write(block)
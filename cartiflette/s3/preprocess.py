@@ -1,17 +1,112 @@
 # -*- coding: utf-8 -*-
 
 from datetime import date
-from typing import TypedDict
+from functools import lru_cache
+from typing import List, TypedDict
 import io
 import logging
+import re
 import pandas as pd
+from pebble import ThreadPool
 import s3fs
 
-from cartiflette.config import BUCKET, PATH_WITHIN_BUCKET, FS
+from cartiflette.config import BUCKET, PATH_WITHIN_BUCKET, FS, THREADS_DOWNLOAD
 from cartiflette.utils import magic_csv_reader
 
 logger = logging.getLogger(__name__)
 
+COG_LEVELS = (
+    "COMMUNE",
+    "CANTON",
+    "ARRONDISSEMENT",
+    "DEPARTEMENT",
+    "REGION",
+    "COLLECTIVITE",
+    "PAYS",
+)
+
+
+@lru_cache(maxsize=256)
+def _glob_to_regex(pattern: str) -> re.Pattern:
+    """
+    Translate a glob pattern (using s3fs' semantics, where "**" spans any
+    number of directories) into a compiled regex.
+    """
+    parts = []
+    for token in re.split(r"(\*\*/|\*\*|\*|\?)", pattern):
+        if token == "**/":
+            parts.append("(?:.*/)?")
+        elif token == "**":
+            parts.append(".*")
+        elif token == "*":
+            parts.append("[^/]*")
+        elif token == "?":
+            parts.append("[^/]")
+        else:
+            parts.append(re.escape(token))
+    return re.compile("".join(parts) + r"\Z")
+
+
+def _list_prefix(fs: s3fs.S3FileSystem, pattern: str) -> List[str]:
+    """
+    List all the files stored under the static prefix of a glob pattern (ie.
+    everything before its first wildcard), with a single paginated
+    list_objects_v2 call.
+
+    Parameters
+    ----------
+    fs : s3fs.S3FileSystem
+        S3 file system to use.
+    pattern : str
+        Glob pattern.
+
+    Returns
+    -------
+    List[str]
+        Files stored under the pattern's prefix (which may not all match the
+        pattern).
+
+    """
+    prefix = re.split(r"[*?\[]", pattern, maxsplit=1)[0]
+    base_dir, _, name_prefix = prefix.rpartition("/")
+    # Nota : s3fs forwards prefix to S3, which then filters the keys itself
+    kwargs = {"prefix": name_prefix} if name_prefix else {}
+    return fs.find(base_dir, **kwargs)
+
+
+def _fast_glob(
+    fs: s3fs.S3FileSystem, pattern: str, listing: List[str] = None
+) -> List[str]:
+    """
+    Equivalent of fs.glob(pattern) which lists the static prefix of the
+    pattern once (one paginated list_objects_v2 call with Prefix=...) and
+    filters the results in python, instead of letting s3fs walk each
+    pseudo-directory matched by "**".
+
+    Parameters
+    ----------
+    fs : s3fs.S3FileSystem
+        S3 file system to use.
+    pattern : str
+        Glob pattern.
+    listing : List[str], optional
+        Result of _list_prefix, to share a single listing between patterns
+        having the same static prefix. The default is None (the prefix is
+        listed).
+
+    Returns
+    -------
+    List[str]
+        Sorted list of matching files.
+
+    """
+    if not re.search(r"[*?\[]", pattern):
+        return [pattern] if fs.exists(pattern) else []
+    if listing is None:
+        listing = _list_prefix(fs, pattern)
+    regex = _glob_to_regex(pattern)
+    return sorted(p for p in listing if regex.match(p))
+
 
 class CogDict(TypedDict):
     "Used only for typing hints"
@@ -29,6 +124,8 @@ def get_cog_year(
     bucket: str = BUCKET,
     path_within_bucket: str = PATH_WITHIN_BUCKET,
     fs: s3fs.S3FileSystem = FS,
+    columns: List[str] = None,
+    use_pyarrow_backend: bool = False,
 ) -> CogDict:
     """
     Retrieve all COG files on S3, concat all territories and store it into a
@@ -44,6 +141,16 @@ def get_cog_year(
         path within bucket. The default is PATH_WITHIN_BUCKET.
     fs : s3fs.S3FileSystem, optional
         S3 file system to use. The default is FS.
+    columns : List[str], optional
+        Columns to keep. As each level has its own columns, any column
+        missing from a level is silently ignored. The default is None (all
+        columns).
+    use_pyarrow_backend : bool, optional
+        Whether to store columns in pyarrow-backed arrays instead of numpy
+        ones. This roughly halves the memory used by string columns, but
+        accessing a column's .values then returns an ArrowExtensionArray
+        instead of a numpy array. If columns is None, the CSV files are then
+        also parsed by pyarrow's multithreaded reader. The default is False.
 
     Returns
     -------
@@ -134,34 +241,53 @@ def get_cog_year(
     if not year:
         year = date.today().year
 
-    levels = [
-        "COMMUNE",
-        "CANTON",
-        "ARRONDISSEMENT",
-        "DEPARTEMENT",
-        "REGION",
-        "COLLECTIVITE",
-        "PAYS",
-    ]
-
-    dict_cog = {}
-    for level in levels:
-        pattern = (
+    kwargs = {}
+    if columns:
+        # Only parse the desired columns
+        columns = set(columns)
+        kwargs["usecols"] = lambda x: x in columns
+    if use_pyarrow_backend:
+        kwargs["dtype_backend"] = "pyarrow"
+        if not columns:
+            # Arrow's multithreaded CSV parser (it does not support a
+            # callable usecols)
+            kwargs["engine"] = "pyarrow"
+
+    patterns = {
+        level: (
             f"{bucket}/{path_within_bucket}/{year=}/**/"
             f"provider=Insee/dataset_family=COG/source={level}/**/*.*"
         )
-        files = fs.glob(pattern)  # , refresh=True)
-        # see issue : https://github.com/fsspec/s3fs/issues/504
-        data = []
-        for file in files:
-            with fs.open(file, "rb") as f:
-                dummy = io.BytesIO(f.read())
-            df = magic_csv_reader(dummy)
-            data.append(df)
-        if data:
-            dict_cog[level] = pd.concat(data)
+        for level in COG_LEVELS
+    }
+    # All levels share the same static prefix : list it only once
+    listing = _list_prefix(fs, patterns[COG_LEVELS[0]])
+
+    def func(level):
+        files = _fast_glob(fs, patterns[level], listing=listing)
+        # Nota : fs.cat on a list of paths performs all GETs concurrently
+        # through s3fs' pooled client and returns a {path: bytes} dict
+        blobs = fs.cat(files) if files else {}
+        # Raw contents are released as soon as they are parsed
+        data = [
+            magic_csv_reader(io.BytesIO(blobs.pop(file)), **kwargs)
+            for file in files
+        ]
+        if len(data) == 1:
+            # Most levels come from a single file : no need to concat
+            return level, data[0]
+        elif data:
+            return level, pd.concat(data, ignore_index=True)
         else:
-            dict_cog[level] = pd.DataFrame()
+            return level, pd.DataFrame()
+
+    # Each level is an independant (and I/O bound) set of requests to S3, so
+    # those are performed concurrently
+    if THREADS_DOWNLOAD > 1:
+        with ThreadPool(min(THREADS_DOWNLOAD, len(COG_LEVELS))) as pool:
+            dict_cog = dict(pool.map(func, COG_LEVELS).result())
+    else:
+        dict_cog = dict(func(level) for level in COG_LEVELS)
 
     return dict_cog
 
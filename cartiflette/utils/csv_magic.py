@@ -64,7 +64,9 @@ def magic_csv_reader(path_or_bytes: Union[str, bytes], **kwargs) -> pd.DataFrame
         with open(path_or_bytes, "r", encoding=encoding) as f:
             sample = f.read(4096)
     else:
-        sample = data.decode(encoding)[:4096]
+        # Only decode the beginning of the file (a multibyte char may be
+        # truncated at the end of the slice, hence errors="ignore")
+        sample = data[:16384].decode(encoding, errors="ignore")[:4096]
 
     dialect = sniffer.sniff(sample)
 
@@ -2,6 +2,8 @@
 Collection of utils to reformat inputs
 """
 
+from types import MappingProxyType
+
 DICT_CORRESP_ADMINEXPRESS = {
     "REGION": "INSEE_REG",
     "DEPARTEMENT": "INSEE_DEP",
@@ -16,15 +18,11 @@ DICT_CORRESP_ADMINEXPRESS = {
     "TERRITOIRE": "AREA",
 }
 
-
-def dict_corresp_filter_by() -> dict:
-    """Transforms explicit administrative borders into relevant column
-
-    Returns:
-        dict: Relevant column as well as initial
-            user prompted administrative level
-    """
-    corresp_decoupage_columns = {
+# Nota : the following mappings are built once at import and shared
+# read-only by cartiflette's internals (see standardize_inputs) ; the public
+# getters below return mutable copies
+_CORRESP_FILTER_BY = MappingProxyType(
+    {
         "region": "INSEE_REG",
         "departement": "INSEE_DEP",
         "commune": "INSEE_COM",
@@ -33,17 +31,10 @@ def dict_corresp_filter_by() -> dict:
         "departement_arrondissement": "INSEE_DEP",
         "france_entiere": "territoire",
     }
-    return corresp_decoupage_columns
-
-
-def create_format_standardized() -> dict:
-    """Transforms user-prompted format into geopandas format
+)
 
-    Returns:
-        dict: Geopandas format as well as user-prompted
-         format
-    """
-    format_standardized = {
+_FORMAT_STANDARDIZED = MappingProxyType(
+    {
         "geojson": "geojson",
         "geopackage": "GPKG",
         "gpkg": "GPKG",
@@ -53,7 +44,37 @@ def create_format_standardized() -> dict:
         "parquet": "parquet",
         "topojson": "topojson",
     }
-    return format_standardized
+)
+
+_GPD_DRIVER = MappingProxyType(
+    {
+        "geojson": "GeoJSON",
+        "GPKG": "GPKG",
+        "shp": None,
+        "parquet": None,
+        "topojson": None,
+    }
+)
+
+
+def dict_corresp_filter_by() -> dict:
+    """Transforms explicit administrative borders into relevant column
+
+    Returns:
+        dict: Relevant column as well as initial
+            user prompted administrative level
+    """
+    return dict(_CORRESP_FILTER_BY)
+
+
+def create_format_standardized() -> dict:
+    """Transforms user-prompted format into geopandas format
+
+    Returns:
+        dict: Geopandas format as well as user-prompted
+         format
+    """
+    return dict(_FORMAT_STANDARDIZED)
 
 
 def create_format_driver() -> dict:
@@ -63,14 +84,7 @@ def create_format_driver() -> dict:
         dict: Geopandas driver as well as user-prompted
          format
     """
-    gpd_driver = {
-        "geojson": "GeoJSON",
-        "GPKG": "GPKG",
-        "shp": None,
-        "parquet": None,
-        "topojson": None,
-    }
-    return gpd_driver
+    return dict(_GPD_DRIVER)
 
 
 def official_epsg_codes() -> dict:
@@ -1,15 +1,17 @@
+from functools import lru_cache
+
 from .dict_correspondance import (
-    dict_corresp_filter_by,
-    create_format_standardized,
-    create_format_driver,
+    _CORRESP_FILTER_BY,
+    _FORMAT_STANDARDIZED,
+    _GPD_DRIVER,
 )
 
 
+# Nota : called with the same few formats for each downloaded file, the
+# returned mapping being read-only it is safe to share between calls
+@lru_cache(maxsize=None)
 def standardize_inputs(vectorfile_format):
-    corresp_filter_by_columns = dict_corresp_filter_by()
-    format_standardized = create_format_standardized()
-    gpd_driver = create_format_driver()
-    format_write = format_standardized[vectorfile_format.lower()]
-    driver = gpd_driver[format_write]
+    format_write = _FORMAT_STANDARDIZED[vectorfile_format.lower()]
+    driver = _GPD_DRIVER[format_write]
 
-    return corresp_filter_by_columns, format_write, driver
+    return _CORRESP_FILTER_BY, format_write, driver
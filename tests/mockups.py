@@ -49,10 +49,13 @@ def total_mock_s3(monkeypatch):
 class MockResponse:
     ok = True
 
-    def __init__(self, success=True, content=None, *args, **kwargs):
+    def __init__(
+        self, success=True, content=None, headers=None, *args, **kwargs
+    ):
         if not success:
             self.ok = False
         self.content = content
+        self.headers = headers or {}
 
     def iter_content(self, chunk_size):
         content = self.content
@@ -77,7 +80,7 @@ class MockHttpScraper:
         return response
 
     def get(self, url, *args, **kwargs):
-        return MockResponse(self.success, self.content)
+        return MockResponse(self.success, self.content, self.dict_head)
 
 
 @pytest.fixture
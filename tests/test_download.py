@@ -10,6 +10,7 @@ from cartiflette.download.scraper import (
     MasterScraper,
     validate_file,
     download_to_tempfile_http,
+    download_to_bytes_http,
 )
 from cartiflette.download.download import _download_sources
 from cartiflette.download import download_all
@@ -18,6 +19,7 @@ from tests.conftest import (
     DUMMY_FILE_1,
     DUMMY_FILE_2,
     HASH_DUMMY,
+    CONTENT_DUMMY,
 )
 
 from tests.mockups import (
@@ -138,6 +140,39 @@ def test_download_ko_md5(
         result = download_to_tempfile_http("dummy", session=dummy_scraper)
 
 
+def test_http_download_bytes(mock_httpscraper_download_success):
+    """
+    test de download_to_bytes_http
+    """
+    dummy_scraper = MasterScraper()
+    content = download_to_bytes_http("https://dummy", session=dummy_scraper)
+    assert content == CONTENT_DUMMY
+
+
+def test_download_bytes_ko_length(
+    mock_httpscraper_download_success_corrupt_length,
+):
+    """
+    test de download_to_bytes_http avec un Content-length incohérent
+    -> doit déclencher un IOError
+    """
+    dummy_scraper = MasterScraper()
+    with pytest.raises(IOError):
+        download_to_bytes_http("dummy", session=dummy_scraper)
+
+
+def test_download_bytes_ko_md5(
+    mock_httpscraper_download_success_corrupt_hash,
+):
+    """
+    test de download_to_bytes_http avec un md5 incohérent
+    -> doit déclencher un IOError
+    """
+    dummy_scraper = MasterScraper()
+    with pytest.raises(IOError):
+        download_to_bytes_http("dummy", session=dummy_scraper)
+
+
 # def test_MasterScraper_ko():
 #     """
 #     download_unzip
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+from cartiflette.s3 import list_files_s3
+
+
+class MockFS:
+    "Système de fichiers minimal, contenu stocké dans un dictionnaire"
+
+    def __init__(self, files):
+        self.files = files
+
+    def size(self, path):
+        return len(self.files[path])
+
+    def get(self, remote_files, local_files):
+        for remote_file, local_file in zip(remote_files, local_files):
+            with open(local_file, "wb") as f:
+                f.write(self.files[remote_file])
+
+    def cat_ranges(self, paths, starts, ends, on_error="return"):
+        return [
+            self.files[path][start:end]
+            for path, start, end in zip(paths, starts, ends)
+        ]
+
+
+def test_download_files_from_list(monkeypatch, tmp_path):
+    """
+    test que les gros fichiers téléchargés par morceaux (et les petits en une
+    seule requête) sont reconstitués à l'identique
+    """
+    monkeypatch.setattr(list_files_s3, "CHUNK_SIZE", 10)
+    monkeypatch.setattr(list_files_s3, "RANGES_PER_BATCH", 3)
+    files = {
+        "bucket/COMMUNE.shp": os.urandom(105),
+        "bucket/COMMUNE.dbf": b"small",
+    }
+
+    list_files_s3.download_files_from_list(
+        MockFS(files), list(files), local_dir=str(tmp_path)
+    )
+
+    for remote_file, content in files.items():
+        local_file = tmp_path / remote_file.rsplit("/", maxsplit=1)[-1]
+        assert local_file.read_bytes() == content
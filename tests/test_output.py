@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+import fsspec
+import geopandas as gpd
+import pandas as pd
+import pytest
+
+from cartiflette.api import output
+
+
+def test_download_vectorfile_multiple_kwargs(monkeypatch):
+    """
+    test que les kwargs de download_vectorfile_multiple sont bien transmis
+    à download_vectorfile_single
+    """
+    received = []
+
+    def mock_single(*args, **kwargs):
+        received.append(kwargs)
+        return gpd.GeoDataFrame({"value": [kwargs["value"]]})
+
+    monkeypatch.setattr(output, "download_vectorfile_single", mock_single)
+
+    gdf = output.download_vectorfile_multiple(values=["11", "28"], timeout=5)
+
+    assert len(received) == 2
+    assert all(kwargs["timeout"] == 5 for kwargs in received)
+    assert sorted(gdf["value"]) == ["11", "28"]
+    assert list(gdf.index) == [0, 1]
+
+
+def test_ls_bucket_empty_path():
+    """
+    test qu'un dossier vide du bucket lève une IOError
+    """
+
+    class MockFS:
+        def ls(self, url):
+            return []
+
+    with pytest.raises(IOError):
+        output._ls_bucket("bucket/missing", fs=MockFS())
+
+
+def test_read_parquet_pyarrow_backend(tmp_path):
+    """
+    test que use_pyarrow_backend convertit les colonnes attributaires d'un
+    fichier GeoParquet sans toucher à la géométrie
+    """
+    path = str(tmp_path / "test.parquet")
+    gpd.GeoDataFrame(
+        {"INSEE_DEP": ["01", "02"], "POPULATION": [1.0, 2.0]},
+        geometry=gpd.points_from_xy([0, 1], [0, 1]),
+        crs=4326,
+    ).to_parquet(path)
+
+    gdf = output._read_parquet(path, use_pyarrow_backend=True)
+
+    assert isinstance(gdf, gpd.GeoDataFrame)
+    assert isinstance(gdf.geometry.dtype, gpd.array.GeometryDtype)
+    assert gdf.crs.to_epsg() == 4326
+    assert list(gdf.columns) == ["INSEE_DEP", "POPULATION", "geometry"]
+    assert str(gdf["POPULATION"].dtype) == "double[pyarrow]"
+    assert list(gdf["INSEE_DEP"]) == ["01", "02"]
+
+
+def test_get_bucket_filesystem_fallback(monkeypatch):
+    """
+    test que FS est utilisé si pyarrow refuse les identifiants (jeton sans
+    clé ni secret)
+    """
+    monkeypatch.setattr(output.FS, "key", None)
+    monkeypatch.setattr(output.FS, "secret", None)
+    monkeypatch.setattr(output.FS, "token", "token")
+    output._get_pyarrow_filesystem.cache_clear()
+    try:
+        assert output._get_bucket_filesystem(output.FS) is output.FS
+    finally:
+        output._get_pyarrow_filesystem.cache_clear()
+
+
+def test_https_session_closes_adhoc_scraper(monkeypatch):
+    """
+    test qu'un scraper créé pour des arguments spécifiques est bien fermé
+    """
+    closed = []
+
+    class MockScraper:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            closed.append(self)
+
+    monkeypatch.setattr(output, "MasterScraper", MockScraper)
+
+    with output._https_session("https", None, expire_after=0) as session:
+        assert isinstance(session, MockScraper)
+    assert closed == [session]
+
+    with output._https_session("bucket", None, expire_after=0) as session:
+        assert session is None
+    assert len(closed) == 1
+
+
+GDF = gpd.GeoDataFrame(
+    {"INSEE_DEP": ["01", "02", "03"], "POPULATION": [1, 2, 3]},
+    geometry=gpd.points_from_xy([0, 1, 2], [0, 1, 2]),
+    crs=4326,
+)
+
+
+class MockFS:
+    "Bucket minimal, chaque fichier téléchargé ayant le même contenu"
+
+    def __init__(self, content, on_download=None, endpoint_url=None):
+        self.content = content
+        self.on_download = on_download
+        self.client_kwargs = {"endpoint_url": endpoint_url}
+        self.downloads = []
+
+    def download(self, rpath, lpath):
+        self.downloads.append(rpath)
+        with open(lpath, "wb") as f:
+            f.write(self.content)
+        if self.on_download:
+            self.on_download(rpath)
+
+    def cat_file(self, path):
+        self.downloads.append(path)
+        return self.content
+
+
+@pytest.fixture
+def cache_dir(monkeypatch, tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    monkeypatch.setattr(output, "CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+def download_cached(fs, **kwargs):
+    return output.download_vectorfile_single(
+        type_download="bucket", fs=fs, use_cache=True, **kwargs
+    )
+
+
+def test_download_vectorfile_single_no_cache(cache_dir):
+    """
+    test que, par défaut, rien n'est écrit dans le cache
+    """
+    fs = MockFS(GDF.to_json().encode("utf8"))
+
+    output.download_vectorfile_single(type_download="bucket", fs=fs)
+    gdf = output.download_vectorfile_single(type_download="bucket", fs=fs)
+
+    assert len(fs.downloads) == 2
+    assert list(gdf["INSEE_DEP"]) == ["01", "02", "03"]
+    assert not os.path.exists(cache_dir)
+
+
+def test_download_vectorfile_single_cache(cache_dir):
+    """
+    test que le premier téléchargement alimente le cache et que les appels
+    suivants le réutilisent
+    """
+    fs = MockFS(GDF.to_json().encode("utf8"))
+
+    gdf = download_cached(fs)
+    assert len(fs.downloads) == 1
+    # le répertoire temporaire a été renommé en entrée de cache
+    url = fs.downloads[0]
+    key = os.path.basename(output._get_cache_dir(url, fs))
+    assert os.listdir(cache_dir) == [key]
+
+    gdf_cached = download_cached(fs)
+    assert len(fs.downloads) == 1
+    assert list(gdf_cached["INSEE_DEP"]) == list(gdf["INSEE_DEP"])
+
+
+def test_cache_key_endpoint():
+    """
+    test qu'un même chemin lu sur deux endpoints S3 (ou en https) correspond
+    à deux entrées distinctes du cache
+    """
+    url = "bucket/path/raw.geojson"
+    fs1 = MockFS(b"", endpoint_url="https://minio.example.com")
+    fs2 = MockFS(b"", endpoint_url="https://s3.example.com")
+
+    keys = {
+        output._get_cache_dir(url, fs1),
+        output._get_cache_dir(url, fs2),
+        output._get_cache_dir(url),
+    }
+    assert len(keys) == 3
+
+
+def test_download_vectorfile_single_concurrent_cache(cache_dir):
+    """
+    test le cas où un appel concurrent a déjà alimenté le cache pendant le
+    téléchargement (os.replace échoue, le fichier en cache est utilisé)
+    """
+
+    def fill_cache(url):
+        local_dir = output._get_cache_dir(url, fs)
+        os.makedirs(local_dir)
+        with open(os.path.join(local_dir, os.path.basename(url)), "w") as f:
+            f.write(GDF.to_json())
+
+    fs = MockFS(b"not a geojson", on_download=fill_cache)
+
+    gdf = download_cached(fs)
+
+    assert list(gdf["INSEE_DEP"]) == ["01", "02", "03"]
+    # aucun répertoire temporaire ne subsiste
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_download_vectorfile_single_missing_file(cache_dir):
+    """
+    test qu'un fichier absent du bucket lève une IOError sans laisser de
+    répertoire temporaire dans le cache
+    """
+
+    class MissingFS:
+        def download(self, rpath, lpath):
+            raise FileNotFoundError(rpath)
+
+    with pytest.raises(IOError):
+        download_cached(MissingFS())
+    assert os.listdir(cache_dir) == []
+
+
+def test_invalidate_cache(cache_dir):
+    """
+    test que invalidate_cache supprime une entrée (ou tout le cache) et
+    provoque un nouveau téléchargement
+    """
+    fs = MockFS(GDF.to_json().encode("utf8"))
+
+    download_cached(fs)
+    download_cached(fs, value="11")
+    assert len(fs.downloads) == 2
+
+    output.invalidate_cache(fs.downloads[0], fs)
+    assert len(os.listdir(cache_dir)) == 1
+    download_cached(fs)
+    assert len(fs.downloads) == 3
+
+    output.invalidate_cache()
+    assert not os.path.exists(cache_dir)
+    download_cached(fs, value="11")
+    assert len(fs.downloads) == 4
+
+
+def test_read_parquet_filters(tmp_path):
+    """
+    test la lecture partielle (colonnes et lignes) d'un fichier parquet,
+    GeoParquet ou non
+    """
+    path = str(tmp_path / "geo.parquet")
+    GDF.to_parquet(path)
+    gdf = output._read_parquet(
+        path,
+        columns=["INSEE_DEP", "geometry"],
+        filters=[("INSEE_DEP", "in", ["01", "03"])],
+    )
+    assert isinstance(gdf, gpd.GeoDataFrame)
+    assert list(gdf.columns) == ["INSEE_DEP", "geometry"]
+    assert list(gdf["INSEE_DEP"]) == ["01", "03"]
+
+    path = str(tmp_path / "plain.parquet")
+    pd.DataFrame(GDF.drop(columns="geometry")).to_parquet(path)
+    df = output._read_parquet(
+        path, columns=["POPULATION"], filters=[("POPULATION", ">", 1)]
+    )
+    assert not isinstance(df, gpd.GeoDataFrame)
+    assert list(df.columns) == ["POPULATION"]
+    assert list(df["POPULATION"]) == [2, 3]
+
+
+def test_download_vectorfile_single_partial_parquet(cache_dir, tmp_path):
+    """
+    test qu'une lecture partielle d'un fichier parquet est faite directement
+    depuis le stockage distant, sans alimenter le cache
+    """
+    config = {
+        "bucket": str(tmp_path),
+        "path_within_bucket": "test",
+        "provider": "IGN",
+        "dataset_family": "ADMINEXPRESS",
+        "source": "EXPRESS-COG-TERRITOIRE",
+        "vectorfile_format": "parquet",
+        "borders": "DEPARTEMENT",
+        "filter_by": "FRANCE_ENTIERE",
+        "territory": "metropole",
+        "year": "2022",
+        "value": "metropole",
+        "crs": 4326,
+        "simplification": 0,
+    }
+    url = output.create_path_bucket(config)
+    os.makedirs(os.path.dirname(url))
+    GDF.to_parquet(url)
+
+    gdf = output.download_vectorfile_single(
+        type_download="bucket",
+        fs=fsspec.filesystem("file"),
+        columns=["INSEE_DEP", "geometry"],
+        filters=[("INSEE_DEP", "=", "02")],
+        **config,
+    )
+
+    assert list(gdf.columns) == ["INSEE_DEP", "geometry"]
+    assert list(gdf["INSEE_DEP"]) == ["02"]
+    assert not os.path.exists(cache_dir)
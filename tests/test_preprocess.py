@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from cartiflette.s3.preprocess import _glob_to_regex
+
+PATTERN = (
+    "bucket/data/year=2022/**/"
+    "provider=Insee/dataset_family=COG/source=COMMUNE/**/*.*"
+)
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        # "**" couvre plusieurs niveaux de dossiers :
+        (
+            "bucket/data/year=2022/a/b/provider=Insee/dataset_family=COG/"
+            "source=COMMUNE/c/d/file.csv",
+            True,
+        ),
+        # "**" couvre aussi zéro dossier :
+        (
+            "bucket/data/year=2022/provider=Insee/dataset_family=COG/"
+            "source=COMMUNE/file.csv",
+            True,
+        ),
+        # Pas de faux positif sur une source au nom proche :
+        (
+            "bucket/data/year=2022/provider=Insee/dataset_family=COG/"
+            "source=COMMUNE_OUTRE_MER/file.csv",
+            False,
+        ),
+        # "*.*" impose une extension au fichier :
+        (
+            "bucket/data/year=2022/provider=Insee/dataset_family=COG/"
+            "source=COMMUNE/file",
+            False,
+        ),
+    ],
+)
+def test_glob_to_regex(path, expected):
+    """
+    test que la traduction des patterns glob de s3fs en regex est correcte
+    """
+    assert bool(_glob_to_regex(PATTERN).match(path)) is expected